@@ -5,30 +5,40 @@ import argparse
 import os
 import re
 
-def replace_in_file(path, regex, replacement):
-    regex = re.compile(regex)
+MAJOR_VERSION_REGEX = re.compile(r'LootVersion::major = \d+;')
+MINOR_VERSION_REGEX = re.compile(r'LootVersion::minor = \d+;')
+PATCH_VERSION_REGEX = re.compile(r'LootVersion::patch = \d+;')
+RESOURCE_VERSION_REGEX = re.compile(r'VERSION \d+, \d+, \d+')
+RESOURCE_VERSION_STRING_REGEX = re.compile(r'Version", "\d+\.\d+\.\d+"')
 
-    lines = []
+def replace_in_file(path, substitutions):
     with open(path) as infile:
-        for line in infile:
-            lines.append(re.sub(regex, replacement, line))
+        content = infile.read()
 
-    with open(path, 'w') as outfile:
-        for line in lines:
-            outfile.write(line)
+    new_content = content
+    for regex, replacement in substitutions:
+        new_content = regex.sub(replacement, new_content)
+
+    if new_content != content:
+        with open(path, 'w') as outfile:
+            outfile.write(new_content)
 
 def update_cpp_file(path, version):
     version_parts = version.split('.')
 
-    replace_in_file(path, 'LootVersion::major = \d+;', 'LootVersion::major = {};'.format(version_parts[0]))
-    replace_in_file(path, 'LootVersion::minor = \d+;', 'LootVersion::minor = {};'.format(version_parts[1]))
-    replace_in_file(path, 'LootVersion::patch = \d+;', 'LootVersion::patch = {};'.format(version_parts[2]))
+    replace_in_file(path, [
+        (MAJOR_VERSION_REGEX, 'LootVersion::major = {};'.format(version_parts[0])),
+        (MINOR_VERSION_REGEX, 'LootVersion::minor = {};'.format(version_parts[1])),
+        (PATCH_VERSION_REGEX, 'LootVersion::patch = {};'.format(version_parts[2])),
+    ])
 
 def update_resource_file(path, version):
     comma_separated_version = version.replace('.', ', ')
 
-    replace_in_file(path, 'VERSION \d+, \d+, \d+', 'VERSION {}'.format(comma_separated_version))
-    replace_in_file(path, 'Version", "\d+\.\d+\.\d+"', 'Version", "{}"'.format(version))
+    replace_in_file(path, [
+        (RESOURCE_VERSION_REGEX, 'VERSION {}'.format(comma_separated_version)),
+        (RESOURCE_VERSION_STRING_REGEX, 'Version", "{}"'.format(version)),
+    ])
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description = 'Set the libloot version number')